@@ -3,27 +3,55 @@
 Централизованное управление всеми настройками проекта
 """
 
-from typing import List, Optional
+import functools
+import logging
+from typing import Annotated, List, Optional
 
-from dotenv import load_dotenv
-from pydantic import Field, validator
-from pydantic_settings import BaseSettings
+from pydantic import (
+    Field,
+    StringConstraints,
+    field_validator,
+    model_validator,
+)
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
-load_dotenv()
+# Формат токена проверяется Rust-регуляркой pydantic-core
+# один раз при сборке класса, а не Python-кодом на каждый запуск.
+TelegramToken = Annotated[str, StringConstraints(
+    pattern=r'^[^:]+:[A-Za-z0-9_-]{20,}$',
+    min_length=30,
+)]
+PhotoroomKey = Annotated[str, StringConstraints(min_length=1)]
+
+# Признаки режима разработки: frozenset даёт O(1) проверку
+# принадлежности без пересборки списков на каждый вызов.
+_DEV_HOSTS = frozenset({'127.0.0.1', 'localhost'})
+_DEV_PORTS = frozenset({8000, 8080})
+
+logger = logging.getLogger(__name__)
 
 
 class Settings(BaseSettings):
     """Настройки приложения."""
 
+    # ⚙Конфигурация Pydantic
+    model_config = SettingsConfigDict(
+        env_file='.env',
+        env_file_encoding='utf-8',
+        case_sensitive=False,
+        use_enum_values=True,
+        extra='ignore',
+    )
+
     # ==================== 🔐 API КЛЮЧИ И ТОКЕНЫ ====================
-    TELEGRAM_BOT_TOKEN: str = Field(
+    TELEGRAM_BOT_TOKEN: TelegramToken = Field(
         default=...,
         description='Токен бота в Telegram',
         example='1234567890:ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghi',
     )
 
-    PHOTOROOM_API_KEY: str = Field(
+    PHOTOROOM_API_KEY: PhotoroomKey = Field(
         default=...,
         description='API ключ для сервиса Photoroom',
         example='photoroom_apikey_1234567890abcdef',
@@ -57,6 +85,11 @@ class Settings(BaseSettings):
         description='Максимальный размер изображения в МБ',
         ge=1, le=50,  # От 1 до 50 МБ
     )
+    MAX_IMAGE_SIZE_BYTES: int = Field(
+        default=0,
+        description='Максимальный размер изображения в байтах '
+                    '(вычисляется из MAX_IMAGE_SIZE_MB)',
+    )
     DEFAULT_IMAGE_QUALITY: int = Field(
         default=85,
         description='Качество изображения по умолчанию (0-100)',
@@ -113,130 +146,112 @@ class Settings(BaseSettings):
 
     # ==================== 🔧 ВАЛИДАТОРЫ ============================
 
-    @validator('TELEGRAM_BOT_TOKEN')
-    def validate_telegram_token(
-            cls, v: Optional[str],  # noqa: N805
-    ) -> str:
-        """Валидация токена Telegram бота."""
-        if not v or v == 'your_telegram_bot_token_here':
-            raise ValueError(
-                '❌ TELEGRAM_BOT_TOKEN не настроен. '
-                'Проверьте .env файл',
-            )
-        if ':' not in v or len(v) < 30:
-            raise ValueError('❌ Неверный формат TELEGRAM_BOT_TOKEN')
+    @field_validator('WEBHOOK_URL')
+    @classmethod
+    def validate_webhook_url(cls, v: Optional[str]) -> str | None:
+        """Валидация URL вебхука."""
+        if v and v.startswith('https://yourdomain'):
+            return None  # Игнорируем пример из .env.example
         return v
 
-    @validator('PHOTOROOM_API_KEY')
-    def validate_photoroom_key(
-            cls, v: Optional[str],  # noqa: N805
-    ) -> str:
-        """Валидация ключа Photoroom API."""
-        if not v or v == 'your_photoroom_api_key_here':
+    @model_validator(mode='after')
+    def validate_consistency(self) -> 'Settings':
+        """Валидация связанных настроек за один проход."""
+        if self.PHOTOROOM_API_KEY == 'your_photoroom_api_key_here':
             raise ValueError(
                 '❌ PHOTOROOM_API_KEY не настроен. '
                 'Проверьте .env файл',
             )
-        return v
-
-    @validator('WEBHOOK_URL')
-    def validate_webhook_url(
-            cls, v: Optional[str],  # noqa: N805
-    ) -> str | None:
-        """Валидация URL вебхука."""
-        if v and v.startswith('https://yourdomain'):
-            return None  # Игнорируем пример из .env.example
-        return v
-
-    @validator('DEFAULT_PROCESSOR')
-    def validate_default_processor(
-            cls, v: Optional[str], values: dict[str, bool],  # noqa: N805
-    ) -> str:
-        """Валидация процессора по умолчанию."""
-        if v == 'photoroom' and not values.get(
-                'ENABLE_PHOTOROOM',
-                True,
-        ):
+        if self.DEFAULT_PROCESSOR == 'photoroom' \
+                and not self.ENABLE_PHOTOROOM:
             raise ValueError(
                 '❌ Photoroom отключен, но выбран '
                 'как процессор по умолчанию',
             )
-        if v == 'pillow' and not values.get('ENABLE_PILLOW', True):
+        if self.DEFAULT_PROCESSOR == 'pillow' \
+                and not self.ENABLE_PILLOW:
             raise ValueError(
                 '❌ Pillow отключен, но выбран '
                 'как процессор по умолчанию',
             )
-        return v
+        # Байтовый лимит считается один раз при валидации,
+        # чтобы горячие пути читали готовый атрибут.
+        self.MAX_IMAGE_SIZE_BYTES = self.MAX_IMAGE_SIZE_MB << 20
+        return self
 
     # ==================== 🎯 СВОЙСТВА ДЛЯ УДОБСТВА =================
-    @property
+    # Настройки после загрузки не меняются, поэтому производные
+    # значения кэшируются и считаются только при первом обращении.
+    @functools.cached_property
     def is_development(self) -> bool:
         """Проверка, что это режим разработки."""
-        return self.HOST in [
-            '127.0.0.1',
-            'localhost',
-        ] or self.PORT in [8000, 8080]
+        return self.HOST in _DEV_HOSTS or self.PORT in _DEV_PORTS
 
-    @property
+    @functools.cached_property
     def is_production(self) -> bool:
         """Проверка, что это продакшен режим."""
         return (self.WEBHOOK_URL is not None and
                 not self.is_development)
 
-    @property
-    def max_image_size_bytes(self) -> int:
-        """Максимальный размер изображения в байтах."""
-        return self.MAX_IMAGE_SIZE_MB * 1024 * 1024
-
-    @property
+    @functools.cached_property
     def webhook_enabled(self) -> bool:
         """Проверка, включены ли вебхуки."""
         return self.WEBHOOK_URL is not None and self.is_production
 
-    class Config:
-        """⚙Конфигурация Pydantic."""
+    @functools.cached_property
+    def supported_formats_set(self) -> frozenset[str]:
+        """Поддерживаемые форматы как frozenset для O(1) проверки.
 
-        env_file = '.env'
-        env_file_encoding = 'utf-8'
-        case_sensitive = False
-        use_enum_values = True
+        Нормализует форматы в верхний регистр один раз, чтобы
+        вызывающий код не делал str.upper() на каждой проверке.
+        """
+        return frozenset(f.upper() for f in self.SUPPORTED_FORMATS)
 
 
 # ==================== 🎯 ГЛОБАЛЬНЫЙ ЭКЗЕМПЛЯР И ФУНКЦИИ ============
-_settings_instance: Optional[Settings] = None
+
+def _log_settings(settings: Settings) -> None:
+    """Вывод статуса настроек после первой загрузки."""
+    # Одна многострочная запись вместо пяти print:
+    # один write-сисколл, статусы подставляются сразу в аргументы,
+    # а ленивый %-формат ничего не стоит, если уровень INFO отключён.
+    logger.info(
+        '✅ Настройки приложения успешно загружены\n'
+        '\t🌐 Host: %s\n'
+        '\t🚪 Port: %d\n'
+        '\t🤖 Telegram Bot: %s\n'
+        '\t🎨 Photoroom API: %s\n'
+        '\t🌐 Webhook: %s',
+        settings.HOST,
+        settings.PORT,
+        '✅ Настроен' if settings.TELEGRAM_BOT_TOKEN else '❌ Нет',
+        '✅ Настроен' if settings.PHOTOROOM_API_KEY else '❌ Нет',
+        settings.WEBHOOK_URL or '❌ Локальный режим',
+    )
 
 
+@functools.lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """ПОЛУЧЕНИЕ ЭКЗЕМПЛЯРА НАСТРОЕК.
 
-    Гарантирует, что настройки загружаются только один раз
+    Результат мемоизируется, поэтому настройки
+    загружаются только один раз.
     """
-    global _settings_instance
-
-    if _settings_instance is None:
-        try:
-            _settings_instance = Settings()
+    settings = Settings()
+    _log_settings(settings)
+    return settings
 
-            settings_instance = '✅ Настроен' \
-                if _settings_instance.TELEGRAM_BOT_TOKEN else '❌ Нет'
-            photo_api = '✅ Настроен' \
-                if _settings_instance.PHOTOROOM_API_KEY else '❌ Нет'
-            webhook = '✅ ' + _settings_instance.WEBHOOK_URL \
-                if _settings_instance.WEBHOOK_URL else '❌ Локальный режим'
 
-            print('✅ Настройки приложения успешно загружены')
-            print(f'\t🌐 Host: {_settings_instance.HOST}')
-            print(f'\t🚪 Port: {_settings_instance.PORT}')
-            print(f'\t🤖 Telegram Bot: {settings_instance}')
-            print(f'\t🎨 Photoroom API: {photo_api}')
-            print(f'\t🌐 Webhook: {webhook}')
+def __getattr__(name: str) -> Settings:
+    """Ленивый модульный атрибут SETTINGS (PEP 562).
 
-        except Exception as e:
-            print(f'❌ Ошибка загрузки настроек: {e}')
-            print('📋 Проверьте .env файл или переменные окружения')
-            raise
-
-    return _settings_instance
+    Позволяет контроллерам импортировать готовый экземпляр напрямую
+    (`from ... import SETTINGS`) и обращаться к нему без Depends
+    и без цепочки request.app.state.settings.
+    """
+    if name == 'SETTINGS':
+        return get_settings()
+    raise AttributeError(name)
 
 
 def reload_settings() -> Settings:
@@ -244,8 +259,7 @@ def reload_settings() -> Settings:
 
     Полезно при изменении .env файла во время работы.
     """
-    global _settings_instance
-    _settings_instance = None
+    get_settings.cache_clear()
     return get_settings()
 
 
@@ -254,13 +268,15 @@ def reload_settings() -> Settings:
 class TestSettings(Settings):
     """Класс для настроек при тесте."""
 
-    class Config:
-        """Настройки для тестов."""
-
-        env_file = '.env.test'
-        env_file_encoding = 'utf-8'
+    # Наследуем конфигурацию родителя, переопределяя только env-файл
+    model_config = {
+        **Settings.model_config,
+        'env_file': '.env.test',
+        'env_file_encoding': 'utf-8',
+    }
 
 
+@functools.lru_cache(maxsize=1)
 def get_test_settings() -> Settings:
     """Получение настроек для тестов."""
     return TestSettings()
@@ -1,32 +1,54 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from photo_bot.infrastructure.config.settings import get_settings
 from photo_bot.presentation.api.v1.routers import v1_router
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:  # noqa: RUF029
+    """Отложенная инициализация состояния после старта event loop."""
+    app.state.settings = get_settings()
+    yield
+
+
+_DESCRIPTION = """
+🎨 Telegram бот для обработки фотографий
+Возможности:
+- 🎭 Удаление фона через Photoroom API
+- 🌅 Изменение фона по описанию
+- 📐 Изменение размера изображений
+- 🎨 Применение фильтров (Pillow)
+API:
+- `POST /webhook` - Webhook для Telegram
+- `GET /health` - Проверка здоровья сервиса
+- `GET /set_webhook` - Установка webhook
+"""
+
+
 def create_application() -> FastAPI:
     """Фабрика для создания приложения."""
     settings = get_settings()
-    app = FastAPI(
-        title="🤖 Photo Editor Bot API",
-        description=("""
-        🎨 Telegram бот для обработки фотографий
-        Возможности:
-        - 🎭 Удаление фона через Photoroom API
-        - 🌅 Изменение фона по описанию
-        - 📐 Изменение размера изображений
-        - 🎨 Применение фильтров (Pillow)
-        API:
-        - `POST /webhook` - Webhook для Telegram
-        - `GET /health` - Проверка здоровья сервиса
-        - `GET /set_webhook` - Установка webhook
-        """),
-        version="1.0.0",
-        docs_url='/docs',
-        redoc_url='/redoc',
-    )
+    kwargs: dict = {
+        'title': '🤖 Photo Editor Bot API',
+        'version': '1.0.0',
+        'default_response_class': ORJSONResponse,
+        'lifespan': lifespan,
+    }
+    if settings.is_production:
+        # В продакшене OpenAPI-схема и документация не строятся
+        kwargs.update(openapi_url=None, docs_url=None, redoc_url=None)
+    else:
+        kwargs.update(
+            description=_DESCRIPTION,
+            docs_url='/docs',
+            redoc_url='/redoc',
+        )
+    app = FastAPI(**kwargs)
     app.include_router(v1_router)
-    app.state.settings = settings
     #if settings.is_development:
     #    print('🛠️ Режим разработки')
     #if settings.webhook_enabled:
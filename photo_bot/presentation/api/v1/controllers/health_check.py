@@ -1,30 +1,56 @@
-from datetime import datetime
+import time
 
-from fastapi import APIRouter, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Request, Response
+import orjson
 
 
 router = APIRouter()
 
+# Тело корневого ответа постоянно — сериализуем его один раз
+# при импорте и отдаём готовые байты без повторной сериализации.
+_ROOT_BODY = orjson.dumps({
+    'message': '🤖 Photo Editor Bot API работает!',
+    'status': 'success',
+    'version': '1.0.0',
+})
+_ROOT_RESP = Response(
+    content=_ROOT_BODY,
+    media_type='application/json',
+)
+
+# Кэш сериализованного тела /health с точностью до секунды:
+# всплеск проб делит одни готовые байты вместо сериализации
+# на каждый запрос.
+_health_cache: list = [0, b'']
+
+
+def _health_body() -> bytes:
+    """Тело ответа /health, обновляемое раз в секунду."""
+    sec = int(time.time())
+    if sec != _health_cache[0]:
+        _health_cache[0] = sec
+        _health_cache[1] = orjson.dumps({
+            'status': 'healthy',
+            'message': '✅ Сервис работает',
+            'timestamp': time.strftime(
+                '%Y-%m-%dT%H:%M:%S',
+                time.gmtime(sec),
+            ),
+        })
+    return _health_cache[1]
+
 
 @router.get('/', tags=['Health'])
-async def root() -> dict:
+async def root() -> Response:
     """Корневой endpoint для проверки работы API."""
-    return {
-        'message': '🤖 Photo Editor Bot API работает!',
-        'status': 'success',
-        'version': '1.0.0',
-    }
+    return _ROOT_RESP
 
 
-@router.get('/health', tags=['Health'])
-async def health_check() -> JSONResponse:
+# Регистрируется как «голый» Starlette-маршрут (см. routers.py),
+# минуя разбор зависимостей и параметров FastAPI.
+async def health_check(request: Request) -> Response:  # noqa: RUF029
     """Проверка здоровья сервиса."""
-    return JSONResponse(
-        status_code=status.HTTP_200_OK,
-        content={
-            'status': 'healthy',
-            'message': '✅ Сервис работает',
-            'timestamp': datetime.now().isoformat(),
-        },
+    return Response(
+        content=_health_body(),
+        media_type='application/json',
     )
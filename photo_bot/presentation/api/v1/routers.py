@@ -5,3 +5,11 @@ from .controllers import health_check
 
 v1_router = APIRouter(prefix="/api/v1")
 v1_router.include_router(health_check.router)
+# include_router копирует путь «голого» Route как есть,
+# поэтому префикс роутера добавляем явно.
+v1_router.add_route(
+    v1_router.prefix + '/health',
+    health_check.health_check,
+    methods=['GET'],
+    include_in_schema=False,
+)